@@ -4,6 +4,8 @@ import re
 import os
 import urllib.parse
 import logging
+from abc import ABC, abstractmethod
+from typing import Optional
 from dotenv import load_dotenv
 from blabel import LabelWriter
 
@@ -17,7 +19,61 @@ CLIENT_ID = os.getenv("CLIENT_ID")
 OAUTH_STATE = os.getenv("OAUTH_STATE")
 
 
-class DigiKeyAPI:
+class SupplierBackend(ABC):
+    """
+    Interface for a source of part details.
+
+    Attributes:
+    -----------
+    name : str
+        A short, unique name for the backend, used for logging and latency stats.
+        Subclasses must set it.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        ...
+
+    @abstractmethod
+    def lookup(self, part_number: str) -> Optional[dict]:
+        """
+        Looks up a part by part number.
+
+        Parameters:
+        -----------
+        part_number : str
+            The part number to look up.
+
+        Returns:
+        --------
+        dict or None
+            A response in the shape of a Digi-Key product details response, so
+            that it can be parsed by DKPart, or None if the part was not found.
+        """
+
+
+class LocalCacheBackend(SupplierBackend):
+    """
+    A supplier backend serving previously resolved responses from memory.
+    """
+
+    name = "cache"
+
+    def __init__(self, name: str = "cache"):
+        self.name = name
+        self.responses = {}
+
+    def lookup(self, part_number: str) -> Optional[dict]:
+        return self.responses.get(part_number)
+
+    def store(self, part_number: str, response: dict) -> None:
+        self.responses[part_number] = response
+
+
+class DigiKeyAPI(SupplierBackend):
+    name = "digikey"
+
     def __init__(
         self,
         api_key: str,
@@ -25,12 +81,14 @@ class DigiKeyAPI:
         oauth_state: str,
         vercel_url="https://oauth-callback.vercel.app/api/",
         dk_authorize="https://api.digikey.com/v1/oauth2/authorize",
+        timeout: float = 10,
     ):
         self.vercel_url = vercel_url
         self.dk_authorize = dk_authorize
         self.api_key = api_key
         self.client_id = client_id
         self.oauth_state = oauth_state
+        self.timeout = timeout
         self.token = None
         try:
             assert self.api_key and self.client_id and self.oauth_state
@@ -58,7 +116,9 @@ class DigiKeyAPI:
 
     def verify_token(self, debug=False):
         response = requests.get(
-            self.vercel_url + "verify", headers={"x-api-key": self.api_key}
+            self.vercel_url + "verify",
+            headers={"x-api-key": self.api_key},
+            timeout=self.timeout,
         )
         if debug:
             logging.debug(response.json())
@@ -68,7 +128,9 @@ class DigiKeyAPI:
         if verify:
             assert self.verify_token() == 200
         response = requests.get(
-            self.vercel_url + "token", headers={"x-api-key": self.api_key}
+            self.vercel_url + "token",
+            headers={"x-api-key": self.api_key},
+            timeout=self.timeout,
         )
         self.token = response.json()["access_token"]
         return response.json()["access_token"] if not debug else response.json()
@@ -87,6 +149,15 @@ class DigiKeyAPI:
             part_number = ""
         return part_number
 
+    @staticmethod
+    def part_number_from_scan(barcode: str) -> str:
+        if barcode.startswith("[)>06"):  # if it's a barcode
+            logging.info("Barcode detected. Decoding...")
+            return DigiKeyAPI.decode_barcode(barcode)
+        else:  # if it's a part number
+            logging.info("Barcode not detected. Assuming part number.")
+            return barcode
+
     def product_details(self, token, dk_part_number):
         dk_part_number = urllib.parse.quote(dk_part_number)
         url = f"https://api.digikey.com/Search/v3/Products/{dk_part_number}"
@@ -104,7 +175,9 @@ class DigiKeyAPI:
 
         logging.info("Querying Digi-Key API on Part Number: " + dk_part_number)
         logging.debug(self.get_token())
-        response = requests.get(url, headers=headers, params=params)
+        response = requests.get(
+            url, headers=headers, params=params, timeout=self.timeout
+        )
 
         if response.status_code == 200:
             logging.info("Query successful")
@@ -114,21 +187,20 @@ class DigiKeyAPI:
 
     def get_product_details_from_barcode(self, barcode, debug=False):
         oauth_token = self.get_token(debug=debug)
-        if barcode.startswith("[)>06"):  # if it's a barcode
-            try:
-                logging.info("Barcode detected. Decoding...")
-                part_number = self.decode_barcode(barcode)
-                return self.product_details(oauth_token, part_number)
-            except:
-                logging.error("Error decoding barcode.")
-        else:  # if it's a part number
-            logging.info("Barcode not detected. Assuming part number.")
-            return self.product_details(oauth_token, barcode)
+        part_number = self.part_number_from_scan(barcode)
+        return self.product_details(oauth_token, part_number)
 
     def get_product_details_from_part_number(self, part_number, debug=False):
         oauth_token = self.get_token(debug=debug)
         return self.product_details(oauth_token, part_number)
 
+    def lookup(self, part_number: str) -> Optional[dict]:
+        response = self.get_product_details_from_part_number(part_number)
+        if isinstance(response, dict):
+            return response
+        logging.warning(response)
+        return None
+
 
 class DKPart:
     """
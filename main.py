@@ -1,5 +1,6 @@
-from dk_api import DigiKeyAPI, DKPart
+from dk_api import DigiKeyAPI
 from inventree_manager import InvenTreeManager
+from part_resolver import PartResolver
 from inventree.api import InvenTreeAPI
 import logging
 import os
@@ -21,18 +22,24 @@ invapi = InvenTreeAPI(
 )
 dkapi = DigiKeyAPI(API_KEY, CLIENT_ID, OAUTH_STATE)
 manager = InvenTreeManager(invapi, dkapi)
+# other supplier backends can be added with resolver.register()
+resolver = PartResolver([dkapi])
 
 # options
 # 1. By Barcode
 # 2. By Part Number
 def pangu():
     barcode = input("Scan Barcode or enter Part Number: ")
-    response = dkapi.get_product_details_from_barcode(barcode)
-    this_part = DKPart(response)
+    this_part = resolver.resolve_barcode(barcode)
+    if this_part is None:
+        return
     manager.check_part(this_part)
 
 
 if __name__ == "__main__":
-    while True:
-        pangu()
+    try:
+        while True:
+            pangu()
+    finally:
+        resolver.close()
 
@@ -0,0 +1,197 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dk_api import DigiKeyAPI, DKPart, LocalCacheBackend, SupplierBackend
+import threading
+import logging
+import time
+from typing import Optional
+
+
+class LatencyStats:
+    """
+    Tracks a moving average of lookup latency per backend.
+
+    Attributes:
+    -----------
+    alpha : float
+        Weight given to the newest sample in the moving average.
+    averages : dict
+        Average latency in seconds, keyed by backend name.
+    """
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self.averages = {}
+        self.lock = threading.Lock()
+
+    def record(self, name: str, elapsed: float) -> None:
+        with self.lock:
+            average = self.averages.get(name)
+            if average is None:
+                self.averages[name] = elapsed
+            else:
+                self.averages[name] = self.alpha * elapsed + (1 - self.alpha) * average
+
+    def get(self, name: str) -> float:
+        # backends that have never been tried sort first so they get sampled
+        with self.lock:
+            return self.averages.get(name, 0.0)
+
+
+class Race:
+    """
+    Per-resolve state shared by the lookups racing for one part number.
+
+    Attributes:
+    -----------
+    lock : threading.Lock
+        Guards settled and recorded.
+    settled : bool
+        Whether the race has been won, after which lookups no longer record stats.
+    recorded : set
+        Names of the backends whose latency has been recorded for this race.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.settled = False
+        self.recorded = set()
+
+
+class PartResolver:
+    """
+    Resolves part numbers against several supplier backends with hedged requests.
+
+    The fastest backend (by average latency) is queried first. If it has not
+    answered within hedge_delay seconds, or answered without a usable part, the
+    next backend is started alongside it, and so on. The first response that
+    parses into a DKPart wins.
+
+    Attributes:
+    -----------
+    backends : list
+        The registered SupplierBackend objects, in registration order.
+    cache : LocalCacheBackend
+        Cache checked before any backend, and that successful responses are
+        written back to.
+    hedge_delay : float
+        Seconds to wait on outstanding lookups before starting the next backend.
+    stats : LatencyStats
+        Per-backend latency stats used to order the backends.
+    """
+
+    def __init__(
+        self,
+        backends: list[SupplierBackend],
+        cache: Optional[LocalCacheBackend] = None,
+        hedge_delay: float = 1.0,
+        max_workers: int = 8,
+    ):
+        self.cache = cache if cache is not None else LocalCacheBackend()
+        self.backends = []
+        for backend in backends:
+            self.register(backend)
+        self.hedge_delay = hedge_delay
+        self.stats = LatencyStats()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def close(self) -> None:
+        # don't wait on losers still running; queued lookups are dropped
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def register(self, backend: SupplierBackend) -> None:
+        # latency stats are keyed by name, so names must be unique
+        if any(b.name == backend.name for b in self.backends):
+            raise ValueError(f"A backend named {backend.name} is already registered")
+        self.backends.append(backend)
+
+    def ordered_backends(self) -> list[SupplierBackend]:
+        return sorted(self.backends, key=lambda b: self.stats.get(b.name))
+
+    def timed_lookup(
+        self, backend: SupplierBackend, part_number: str, race: Race
+    ) -> Optional[DKPart]:
+        start = time.monotonic()
+        try:
+            response = backend.lookup(part_number)
+            part = DKPart(response) if response else None
+        except Exception as e:
+            logging.warning(f"{backend.name} lookup failed: {e}")
+            response, part = None, None
+        elapsed = time.monotonic() - start
+        with race.lock:
+            # losers still running when the race settled were recorded then
+            if not race.settled:
+                # penalize misses so an unreliable source drifts down the order
+                self.stats.record(
+                    backend.name, elapsed if part else elapsed + self.hedge_delay
+                )
+                race.recorded.add(backend.name)
+        if part:
+            self.cache.store(part_number, response)
+        return part
+
+    def resolve(self, part_number: str) -> Optional[DKPart]:
+        """
+        Looks up a part number on all backends, hedging after hedge_delay.
+
+        Parameters:
+        -----------
+        part_number : str
+            The part number to look up.
+
+        Returns:
+        --------
+        DKPart or None
+            The first part found, or None if no backend found the part.
+        """
+        response = self.cache.lookup(part_number)
+        if response:
+            logging.info("Part found in local cache")
+            return DKPart(response)
+        race = Race()
+        pending = {}
+        remaining = self.ordered_backends()
+        while remaining or pending:
+            if remaining:
+                backend = remaining.pop(0)
+                logging.info(f"Querying {backend.name} for {part_number}")
+                future = self.executor.submit(
+                    self.timed_lookup, backend, part_number, race
+                )
+                pending[future] = (backend, time.monotonic())
+            done, _ = wait(
+                pending,
+                timeout=self.hedge_delay if remaining else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                backend, start = pending.pop(future)
+                part = future.result()
+                if part:
+                    logging.info(f"Part resolved by {backend.name}")
+                    self.settle(race, pending, time.monotonic() - start)
+                    return part
+        logging.error(f"No backend found part {part_number}")
+        return None
+
+    def settle(self, race: Race, pending: dict, winner_elapsed: float) -> None:
+        with race.lock:
+            race.settled = True
+            now = time.monotonic()
+            for future, (backend, start) in pending.items():
+                # lookups that never started are dropped without a sample
+                if future.cancel() or backend.name in race.recorded:
+                    continue
+                # a loser is slower than the winner, so penalize it like a miss
+                elapsed = max(now - start, winner_elapsed)
+                self.stats.record(backend.name, elapsed + self.hedge_delay)
+                race.recorded.add(backend.name)
+
+    def resolve_barcode(self, barcode: str) -> Optional[DKPart]:
+        return self.resolve(DigiKeyAPI.part_number_from_scan(barcode))
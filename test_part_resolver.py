@@ -0,0 +1,180 @@
+import time
+import unittest
+from typing import Optional
+from unittest import mock
+from dk_api import DigiKeyAPI, LocalCacheBackend, SupplierBackend
+from part_resolver import PartResolver
+
+# a minimal response in the shape of a Digi-Key product details response
+RESPONSE = {
+    "DigiKeyPartNumber": "311-10.0KCRCT-ND",
+    "ProductDescription": "RES 10K OHM 1% 1/10W 0603",
+    "LimitedTaxonomy": {
+        "Parameter": "Categories",
+        "Value": "Resistors",
+        "Children": [{"Parameter": "Categories", "Value": "Chip Resistor"}],
+    },
+}
+BARCODE = "[)>06$P311-10.0KCRCT-ND$1PRC0603FR-0710KL$Q100"
+HEDGE_DELAY = 0.1
+
+
+class StubBackend(SupplierBackend):
+    """
+    A supplier backend that sleeps for delay seconds, then returns response.
+    """
+
+    name = "stub"
+
+    def __init__(self, name: str, delay: float = 0.0, response=RESPONSE):
+        self.name = name
+        self.delay = delay
+        self.response = response
+        self.calls = 0
+        self.requested = []
+
+    def lookup(self, part_number: str) -> Optional[dict]:
+        self.calls += 1
+        self.requested.append(part_number)
+        time.sleep(self.delay)
+        return self.response
+
+
+class PartResolverTest(unittest.TestCase):
+    def make_resolver(self, *backends: SupplierBackend) -> PartResolver:
+        resolver = PartResolver(list(backends), hedge_delay=HEDGE_DELAY)
+        self.addCleanup(resolver.close)
+        return resolver
+
+    def timed_resolve(self, resolver: PartResolver):
+        start = time.monotonic()
+        part = resolver.resolve("311-10.0KCRCT-ND")
+        return part, time.monotonic() - start
+
+    def test_first_backend_answering_in_time_is_not_hedged(self):
+        first = StubBackend("first", delay=0.01)
+        second = StubBackend("second")
+        resolver = self.make_resolver(first, second)
+        part, _ = self.timed_resolve(resolver)
+        self.assertEqual(part.DigiKeyPartNumber, "311-10.0KCRCT-ND")
+        self.assertEqual(second.calls, 0)
+
+    def test_slow_backend_is_hedged_after_delay(self):
+        slow = StubBackend("slow", delay=1.0)
+        fast = StubBackend("fast", delay=0.01)
+        resolver = self.make_resolver(slow, fast)
+        part, elapsed = self.timed_resolve(resolver)
+        self.assertIsNotNone(part)
+        self.assertEqual(fast.calls, 1)
+        self.assertGreaterEqual(elapsed, HEDGE_DELAY)
+        self.assertLess(elapsed, 0.5)
+
+    def test_miss_hedges_immediately(self):
+        miss = StubBackend("miss", response=None)
+        hit = StubBackend("hit")
+        resolver = self.make_resolver(miss, hit)
+        part, elapsed = self.timed_resolve(resolver)
+        self.assertIsNotNone(part)
+        self.assertLess(elapsed, HEDGE_DELAY)
+
+    def test_unparseable_response_counts_as_miss(self):
+        garbage = StubBackend("garbage", response={"Unexpected": "shape"})
+        hit = StubBackend("hit")
+        resolver = self.make_resolver(garbage, hit)
+        part, elapsed = self.timed_resolve(resolver)
+        self.assertEqual(part.DigiKeyPartNumber, "311-10.0KCRCT-ND")
+        self.assertLess(elapsed, HEDGE_DELAY)
+
+    def test_all_backends_missing_returns_none(self):
+        resolver = self.make_resolver(
+            StubBackend("miss1", response=None), StubBackend("miss2", response=None)
+        )
+        part, _ = self.timed_resolve(resolver)
+        self.assertIsNone(part)
+
+    def test_resolved_part_is_written_back_to_cache(self):
+        backend = StubBackend("backend")
+        resolver = self.make_resolver(backend)
+        self.timed_resolve(resolver)
+        part, _ = self.timed_resolve(resolver)
+        self.assertIsNotNone(part)
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual(resolver.cache.lookup("311-10.0KCRCT-ND"), RESPONSE)
+
+    def test_faster_backend_is_ordered_first(self):
+        slow = StubBackend("slow", delay=0.3)
+        fast = StubBackend("fast", delay=0.01)
+        resolver = self.make_resolver(slow, fast)
+        self.timed_resolve(resolver)
+        self.assertEqual(resolver.ordered_backends(), [fast, slow])
+
+    def test_winner_slower_than_hedge_delay_is_ordered_first(self):
+        # the loser is only started as the hedge, so it runs for less time
+        # than the winner before the race ends
+        winner = StubBackend("winner", delay=0.15)
+        loser = StubBackend("loser", delay=1.0)
+        resolver = self.make_resolver(winner, loser)
+        part, _ = self.timed_resolve(resolver)
+        self.assertIsNotNone(part)
+        self.assertEqual(loser.calls, 1)
+        self.assertEqual(resolver.ordered_backends(), [winner, loser])
+
+    def test_loser_latency_is_recorded_once(self):
+        slow = StubBackend("slow", delay=0.3)
+        fast = StubBackend("fast", delay=0.01)
+        resolver = self.make_resolver(slow, fast)
+        self.timed_resolve(resolver)
+        recorded = resolver.stats.get("slow")
+        # let the loser finish; it must not record a second sample
+        time.sleep(0.4)
+        self.assertEqual(resolver.stats.get("slow"), recorded)
+
+    def test_duplicate_backend_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            PartResolver([StubBackend("same"), StubBackend("same")])
+        resolver = self.make_resolver(LocalCacheBackend("stand-in"))
+        with self.assertRaises(ValueError):
+            resolver.register(LocalCacheBackend("stand-in"))
+
+    def test_resolve_barcode_decodes_barcode(self):
+        backend = StubBackend("backend")
+        resolver = self.make_resolver(backend)
+        self.assertIsNotNone(resolver.resolve_barcode(BARCODE))
+        self.assertEqual(backend.requested, ["311-10.0KCRCT-ND"])
+
+    def test_resolve_barcode_passes_part_number_through(self):
+        backend = StubBackend("backend")
+        resolver = self.make_resolver(backend)
+        self.assertIsNotNone(resolver.resolve_barcode("RC0603FR-0710KL"))
+        self.assertEqual(backend.requested, ["RC0603FR-0710KL"])
+
+
+class DigiKeyAPITest(unittest.TestCase):
+    def setUp(self):
+        self.dkapi = DigiKeyAPI("api_key", "client_id", "oauth_state")
+
+    def test_part_number_from_scan_decodes_barcode(self):
+        part_number = DigiKeyAPI.part_number_from_scan(BARCODE)
+        self.assertEqual(part_number, "311-10.0KCRCT-ND")
+
+    def test_part_number_from_scan_passes_part_number_through(self):
+        part_number = DigiKeyAPI.part_number_from_scan("RC0603FR-0710KL")
+        self.assertEqual(part_number, "RC0603FR-0710KL")
+
+    def test_lookup_returns_response(self):
+        with mock.patch.object(
+            self.dkapi, "get_product_details_from_part_number", return_value=RESPONSE
+        ):
+            self.assertEqual(self.dkapi.lookup("311-10.0KCRCT-ND"), RESPONSE)
+
+    def test_lookup_maps_error_to_none(self):
+        with mock.patch.object(
+            self.dkapi,
+            "get_product_details_from_part_number",
+            return_value="Error: 404 - Not Found",
+        ):
+            self.assertIsNone(self.dkapi.lookup("311-10.0KCRCT-ND"))
+
+
+if __name__ == "__main__":
+    unittest.main()